@@ -21,7 +21,7 @@
 const admin = require('firebase-admin');
 const fs = require('fs');
 const path = require('path');
-const os = require('os');
+const { getDb } = require('./service-account');
 
 // Parse command line arguments
 const args = process.argv.slice(2);
@@ -32,30 +32,9 @@ const userId = userIdIndex !== -1 ? args[userIdIndex + 1] : null;
 const backupIdIndex = args.indexOf('--backup-id');
 const backupId = backupIdIndex !== -1 ? args[backupIdIndex + 1] : null;
 
-// Service Account Key Configuration
-const serviceAccountPath = '/Users/kevinbaliat/Desktop/Projects/tokens/meal-planner-4bfa6-firebase-adminsdk-fbsvc-06e6c00494.json';
-const altServiceAccountPath1 = path.join(os.homedir(), '.firebase-credentials', 'service-account-key.json');
-const altServiceAccountPath2 = path.join(__dirname, 'credentials', 'service-account-key.json');
-
-let serviceAccountPathToUse = null;
-if (fs.existsSync(serviceAccountPath)) {
-  serviceAccountPathToUse = serviceAccountPath;
-} else if (fs.existsSync(altServiceAccountPath1)) {
-  serviceAccountPathToUse = altServiceAccountPath1;
-} else if (fs.existsSync(altServiceAccountPath2)) {
-  serviceAccountPathToUse = altServiceAccountPath2;
-} else {
-  throw new Error(`Service account key not found. Checked:\n  ${serviceAccountPath}\n  ${altServiceAccountPath1}\n  ${altServiceAccountPath2}`);
-}
-
-const serviceAccount = require(serviceAccountPathToUse);
-
-// Initialize Firebase Admin
-admin.initializeApp({
-  credential: admin.credential.cert(serviceAccount)
-});
-
-const db = admin.firestore();
+// Initialize Firebase Admin via the shared, memoized loader
+// (resolves the service account key and builds the credential exactly once)
+const db = getDb();
 
 // Backup directory
 const BACKUP_DIR = path.join(__dirname, 'backups');
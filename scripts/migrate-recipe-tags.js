@@ -11,41 +11,11 @@
  * 4. Run: node scripts/migrate-recipe-tags.js
  */
 
-const admin = require('firebase-admin');
-const path = require('path');
-const os = require('os');
+const { getDb } = require('./service-account');
 
-// Service Account Key Configuration
-// Primary location: User-specified path
-const primaryKeyPath = '/Users/kevinbaliat/Desktop/Projects/tokens/meal-planner-4bfa6-firebase-adminsdk-fbsvc-06e6c00494.json';
-
-// Fallback locations
-const secureKeyPath = path.join(os.homedir(), '.firebase-credentials', 'service-account-key.json');
-const projectKeyPath = path.join(__dirname, 'credentials', 'service-account-key.json');
-
-// Try primary location first, then fallbacks
-let serviceAccountPath = primaryKeyPath;
-const fs = require('fs');
-
-if (!fs.existsSync(serviceAccountPath)) {
-  if (fs.existsSync(secureKeyPath)) {
-    serviceAccountPath = secureKeyPath;
-  } else if (fs.existsSync(projectKeyPath)) {
-    serviceAccountPath = projectKeyPath;
-    console.warn('⚠️  Using service account key from project directory. Consider moving to secure location.');
-  } else {
-    throw new Error(`Service account key not found at:\n  ${primaryKeyPath}\n  ${secureKeyPath}\n  ${projectKeyPath}\n\nPlease download from Firebase Console > Project Settings > Service Accounts`);
-  }
-}
-
-const serviceAccount = require(serviceAccountPath);
-
-// Initialize Firebase Admin
-admin.initializeApp({
-  credential: admin.credential.cert(serviceAccount)
-});
-
-const db = admin.firestore();
+// Initialize Firebase Admin via the shared, memoized loader
+// (resolves the service account key and builds the credential exactly once)
+const db = getDb();
 
 /**
  * Generate tags for a recipe based on its data
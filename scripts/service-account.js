@@ -0,0 +1,89 @@
+/**
+ * Shared Service Account Loader
+ *
+ * Every admin script duplicated the same service-account path resolution and
+ * called admin.credential.cert() on its own copy of the key. This module
+ * resolves the key path once, materializes the credential once, and hands
+ * every caller the same initialized Firestore client.
+ *
+ * Loading the key a single time means the parsed private key lives in
+ * exactly one place in memory, and the admin.apps guard means
+ * admin.initializeApp() can no longer throw if two scripts are ever
+ * required into the same process.
+ *
+ * Usage:
+ *   const { getDb } = require('./service-account');
+ *   const db = getDb();
+ */
+
+const admin = require('firebase-admin');
+const fs = require('fs');
+const path = require('path');
+const os = require('os');
+
+// Service Account Key Configuration
+// Primary location first, then fallbacks (same order the scripts used)
+const serviceAccountPath = '/Users/kevinbaliat/Desktop/Projects/tokens/meal-planner-4bfa6-firebase-adminsdk-fbsvc-06e6c00494.json';
+const altServiceAccountPath1 = path.join(os.homedir(), '.firebase-credentials', 'service-account-key.json');
+const altServiceAccountPath2 = path.join(__dirname, 'credentials', 'service-account-key.json');
+
+// Memoized credential and Firestore client
+let cachedCredential = null;
+let cachedDb = null;
+
+/**
+ * Resolve the service account key path, checking the known locations in order.
+ *
+ * @returns {string} Path to the service account key file
+ * @throws {Error} If no key file exists at any known location
+ */
+function resolveServiceAccountPath() {
+  if (fs.existsSync(serviceAccountPath)) {
+    return serviceAccountPath;
+  }
+  if (fs.existsSync(altServiceAccountPath1)) {
+    return altServiceAccountPath1;
+  }
+  if (fs.existsSync(altServiceAccountPath2)) {
+    console.warn('⚠️  Using service account key from project directory. Consider moving to secure location.');
+    return altServiceAccountPath2;
+  }
+  throw new Error(`Service account key not found. Checked:\n  ${serviceAccountPath}\n  ${altServiceAccountPath1}\n  ${altServiceAccountPath2}`);
+}
+
+/**
+ * Load the service account key and build the admin credential exactly once.
+ *
+ * @returns {admin.credential.Credential} The memoized credential
+ */
+function getCredential() {
+  if (!cachedCredential) {
+    const serviceAccount = require(resolveServiceAccountPath());
+    cachedCredential = admin.credential.cert(serviceAccount);
+  }
+  return cachedCredential;
+}
+
+/**
+ * Initialize Firebase Admin (guarded against double initialization) and
+ * return the shared Firestore client.
+ *
+ * @returns {admin.firestore.Firestore} The memoized Firestore client
+ */
+function getDb() {
+  if (!cachedDb) {
+    if (admin.apps.length === 0) {
+      admin.initializeApp({
+        credential: getCredential()
+      });
+    }
+    cachedDb = admin.firestore();
+  }
+  return cachedDb;
+}
+
+module.exports = {
+  getDb,
+  getCredential,
+  resolveServiceAccountPath
+};
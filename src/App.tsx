@@ -3,13 +3,12 @@
 import React, { useState, useEffect } from 'react';
 
 // Import Firebase and Firestore functions
-import { db, collections, requireAuth, onAuthStateChange, signOut } from './firebase';
+import { recipesRef, mealPlansRef, shoppingListsRef, notesRef, usersRef, requireAuth, onAuthStateChange, signOut, userProfileCacheKey } from './firebase';
 
 // Import secure logging utilities
 import { secureLog, secureWarn, secureError } from './utils/secureLogger';
-import { 
-  collection, 
-  addDoc, 
+import {
+  addDoc,
   getDocs, 
   doc, 
   setDoc, 
@@ -17,6 +16,7 @@ import {
   onSnapshot,
   query,
   where,
+  documentId,
   DocumentSnapshot,
   QueryDocumentSnapshot,
   DocumentReference,
@@ -48,8 +48,8 @@ import ShareRecipeModal from './components/ShareRecipeModal';
 // Import the auto-logout hook
 import { useAutoLogout } from './hooks/useAutoLogout';
 
-// Import Google Generative AI for ingredient categorization
-import { GoogleGenerativeAI } from '@google/generative-ai';
+// Import the shared Gemini client for ingredient categorization
+import { getGeminiModel, withGeminiRetry } from './utils/geminiClient';
 
 /**
  * Define TypeScript interfaces for our data structures
@@ -89,7 +89,7 @@ interface UserProfile {
 }
 
 interface WeeklyMealPlan {
-  [key: string]: string;  // day: recipeId
+  [key: string]: string | string[];  // day: recipe IDs (array; legacy docs hold comma-joined strings)
   userId: string;  // Required: identifies the owner of the meal plan
 }
 
@@ -182,6 +182,119 @@ const deduplicateRecipes = (recipes: Recipe[]): Recipe[] => {
   });
 };
 
+/**
+ * Parse the meal IDs stored for a day of a weekly meal plan.
+ *
+ * Meal plans store each day's recipe IDs as a native Firestore array, but
+ * older documents hold a comma-joined string (with '' meaning no meals).
+ * This helper normalizes both shapes to a clean array of IDs so readers
+ * don't have to care which format a document was written with.
+ *
+ * @param value - The raw day entry from a meal plan document
+ * @returns Array of recipe IDs (empty if the day has no meals)
+ */
+const parseMealIds = (value: unknown): string[] => {
+  if (Array.isArray(value)) {
+    return value.filter((id): id is string => typeof id === 'string' && id.length > 0);
+  }
+  if (typeof value === 'string') {
+    return value.split(',').map(id => id.trim()).filter(id => id.length > 0);
+  }
+  return [];
+};
+
+/**
+ * Shared locale-aware date formatters.
+ *
+ * toLocaleDateString constructs a fresh Intl.DateTimeFormat on every call,
+ * and building a formatter is far more expensive than calling .format() on
+ * an existing one. Each formatting shape used in the app is created once at
+ * module load and reused by every call site (the calendar alone formats
+ * dozens of dates per render).
+ */
+const monthDayYearFormat = new Intl.DateTimeFormat('en-US', { month: 'long', day: 'numeric', year: 'numeric' });
+const weekdayFormat = new Intl.DateTimeFormat('en-US', { weekday: 'long' });
+const fullDateFormat = new Intl.DateTimeFormat('en-US', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' });
+const monthYearFormat = new Intl.DateTimeFormat('en-US', { month: 'long', year: 'numeric' });
+const bannerDateFormat = new Intl.DateTimeFormat('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
+
+/**
+ * Cache of computed week-range strings keyed by calendar date.
+ *
+ * The calendar calls getWeekRange for every visible day cell on every render
+ * (up to 42 calls), and each call does date arithmetic plus two locale-aware
+ * format operations. The result for a given date never changes, so memoizing
+ * per date turns repeat calls into a single Map lookup. The cache is kept
+ * bounded by evicting the oldest entry once the limit is reached.
+ */
+const weekRangeCache = new Map<string, string>();
+const WEEK_RANGE_CACHE_LIMIT = 64;
+
+/**
+ * Get Week Range Function
+ *
+ * This function takes a date and returns a string representing the week range
+ * from Monday to Sunday of that week.
+ *
+ * @param date - The date to get the week range for
+ * @returns A string in the format "Month Day Year - Month Day Year"
+ */
+const getWeekRange = (date: Date): string => {
+  const cacheKey = date.toDateString();
+  const cached = weekRangeCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
+  const startOfWeek = new Date(date);
+  // Set to Monday (1) instead of Sunday (0)
+  startOfWeek.setDate(date.getDate() - (date.getDay() || 7) + 1);
+
+  const endOfWeek = new Date(startOfWeek);
+  endOfWeek.setDate(startOfWeek.getDate() + 6); // Set to Sunday
+
+  const weekRange = `${monthDayYearFormat.format(startOfWeek)} - ${monthDayYearFormat.format(endOfWeek)}`;
+
+  // Evict the oldest entry to keep the cache bounded
+  if (weekRangeCache.size >= WEEK_RANGE_CACHE_LIMIT) {
+    const oldestKey = weekRangeCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      weekRangeCache.delete(oldestKey);
+    }
+  }
+  weekRangeCache.set(cacheKey, weekRange);
+
+  return weekRange;
+};
+
+/**
+ * Module-level cache of user profiles fetched for display purposes.
+ *
+ * Owner usernames and emails shown alongside shared recipes change very
+ * rarely, but the components that display them re-fetch the profile on every
+ * mount. Caching profiles by user ID means each owner is read from Firestore
+ * at most once per session; repeat lookups are served from memory.
+ * A null entry records that the profile document does not exist, so missing
+ * profiles are not re-fetched either.
+ */
+const userProfileCache = new Map<string, UserProfile | null>();
+
+/**
+ * Fetch a user profile, serving repeat requests from the in-memory cache.
+ *
+ * @param userId - The Firebase Auth UID of the user to look up
+ * @returns The user's profile, or null if no profile document exists
+ */
+const getUserProfileCached = async (userId: string): Promise<UserProfile | null> => {
+  if (userProfileCache.has(userId)) {
+    return userProfileCache.get(userId) ?? null;
+  }
+  const profileSnap = await getDoc(doc(usersRef, userId));
+  const profile = profileSnap.exists() ? (profileSnap.data() as UserProfile) : null;
+  userProfileCache.set(userId, profile);
+  return profile;
+};
+
 /**
  * App Component - The main component of our application
  * 
@@ -234,47 +347,67 @@ const App: React.FC = () => {
   }, []);
 
   /**
-   * Load User Profile from Firestore
-   * 
-   * This effect loads the user's profile (username, firstName, lastName) from Firestore
-   * whenever the authenticated user changes or when the manage account modal closes.
+   * Subscribe to the User Profile in Firestore
+   *
+   * This effect keeps the user's profile (username, firstName, lastName) in sync
+   * with Firestore whenever the authenticated user changes. Instead of refetching
+   * the profile document (e.g. every time the manage account modal closes), we
+   * register a single onSnapshot listener and let Firestore push changes to us -
+   * edits made in the manage account modal arrive through the same listener.
    * This is used to display the username in the banner.
    */
-  const loadUserProfile = async () => {
+  useEffect(() => {
     if (!user) {
       setUserProfile(null);
       return;
     }
 
+    let profileCacheKey: string;
     try {
       const currentUser = requireAuth();
-      const userProfileRef = doc(db, collections.users, currentUser.uid);
-      const userProfileSnap = await getDoc(userProfileRef);
-      
+      profileCacheKey = userProfileCacheKey(currentUser.uid);
+
+      // Cache-first: show the last-known profile from localStorage right away
+      // (banner display tolerates slightly stale data) while the listener
+      // delivers the authoritative snapshot.
+      try {
+        const cachedProfile = localStorage.getItem(profileCacheKey);
+        if (cachedProfile) {
+          setUserProfile(JSON.parse(cachedProfile) as UserProfile);
+        }
+      } catch (cacheError) {
+        // Corrupted cache entry - ignore it and wait for the snapshot
+        secureWarn('[App] Ignoring unreadable cached user profile');
+      }
+    } catch (error) {
+      secureError('[App] Error loading user profile:', error);
+      setUserProfile(null);
+      return;
+    }
+
+    const userProfileRef = doc(usersRef, user.uid);
+    const unsubscribe = onSnapshot(userProfileRef, (userProfileSnap) => {
       if (userProfileSnap.exists()) {
         const profileData = userProfileSnap.data() as UserProfile;
         setUserProfile(profileData);
+        try {
+          localStorage.setItem(profileCacheKey, JSON.stringify(profileData));
+        } catch (cacheError) {
+          // localStorage may be full or unavailable - the cache is best-effort
+        }
       } else {
-        // Profile doesn't exist yet, set to null
+        // Profile doesn't exist yet, set to null and drop any stale cache
         setUserProfile(null);
+        localStorage.removeItem(profileCacheKey);
       }
-    } catch (error) {
+    }, (error) => {
       secureError('[App] Error loading user profile:', error);
       setUserProfile(null);
-    }
-  };
+    });
 
-  // Load user profile when user changes
-  useEffect(() => {
-    loadUserProfile();
+    // Cleanup: stop listening when the user changes or the app unmounts
+    return () => unsubscribe();
   }, [user]);
-
-  // Reload user profile when manage account modal closes (in case username was updated)
-  useEffect(() => {
-    if (!isManageAccountOpen && user) {
-      loadUserProfile();
-    }
-  }, [isManageAccountOpen, user]);
   
   // Auto-logout after 30 minutes of inactivity
   // This hook monitors user activity and automatically signs out inactive users
@@ -323,7 +456,7 @@ const App: React.FC = () => {
       await signOut();
       setUser(null);
     } catch (error) {
-      console.error('Error signing out:', error);
+      secureError('Error signing out:', error);
     }
   };
   
@@ -343,7 +476,7 @@ const App: React.FC = () => {
   // Effect to handle pending recipe from chatbot - must be at App level to work regardless of current tab
   useEffect(() => {
     if (pendingRecipeFromChatbot) {
-      console.log('App: Switching to recipeLibrary tab for pending recipe');
+      secureLog('App: Switching to recipeLibrary tab for pending recipe');
       // Switch to recipe library tab first
       setActiveTab('recipeLibrary');
       // The RecipeLibrary component's useEffect will handle the form pre-filling
@@ -353,21 +486,12 @@ const App: React.FC = () => {
   
   // Date and meal selection state
   const [selectedDate, setSelectedDate] = useState<Date>(new Date());
-  const [selectedMeal, setSelectedMeal] = useState<string>('');
-  const [savedMessage, setSavedMessage] = useState<string>('');
-  
+
   // Recipe state
   const [recipes, setRecipes] = useState<Recipe[]>([]);
-  const [selectedRecipe, setSelectedRecipe] = useState<string>('');
-  const [newRecipeName, setNewRecipeName] = useState('');
-  const [newIngredient, setNewIngredient] = useState('');
-  const [newRecipeIngredients, setNewRecipeIngredients] = useState<string[]>([]);
-  const [isAddingRecipe, setIsAddingRecipe] = useState(false);
-  const [recipeSaved, setRecipeSaved] = useState(false);
-  
+
   // Shopping list state
   const [selectedWeek, setSelectedWeek] = useState<string>('');
-  const [checkedItems, setCheckedItems] = useState<Set<string>>(new Set());
   
   // Weekly meal plans state
   const [weeklyMealPlans, setWeeklyMealPlans] = useState<WeeklyMealPlans>({});
@@ -380,34 +504,6 @@ const App: React.FC = () => {
   // FIREBASE INTEGRATION
   //===========================================================================
 
-  /**
-   * Get Week Range Function
-   * 
-   * This function takes a date and returns a string representing the week range
-   * from Monday to Sunday of that week.
-   * 
-   * @param date - The date to get the week range for
-   * @returns A string in the format "Month Day Year - Month Day Year"
-   */
-  const getWeekRange = (date: Date): string => {
-    const startOfWeek = new Date(date);
-    // Set to Monday (1) instead of Sunday (0)
-    startOfWeek.setDate(date.getDate() - (date.getDay() || 7) + 1);
-    
-    const endOfWeek = new Date(startOfWeek);
-    endOfWeek.setDate(startOfWeek.getDate() + 6); // Set to Sunday
-    
-    const formatDate = (d: Date) => {
-      return d.toLocaleDateString('en-US', { 
-        month: 'long', 
-        day: 'numeric', 
-        year: 'numeric' 
-      });
-    };
-    
-    return `${formatDate(startOfWeek)} - ${formatDate(endOfWeek)}`;
-  };
-
   /**
    * Load Recipes from Firestore
    * 
@@ -426,43 +522,58 @@ const App: React.FC = () => {
       // Require authentication - throws error if not authenticated
       const currentUser = requireAuth();
       const userId = currentUser.uid;
-      
+
       // Create a query that gets recipes owned by the user OR shared with them
-      // Note: Firestore doesn't support OR queries directly, so we'll fetch both and merge
-        const recipesRef = collection(db, collections.recipes);
-      
+      // Note: Firestore doesn't support OR queries directly, so we run two
+      // indexed queries concurrently and merge their results. The shared
+      // recipes used to be found by fetching the ENTIRE recipes collection
+      // and filtering client-side on every owned-recipes update; the
+      // array-contains query below lets the server do that filtering and
+      // keeps both halves live via their own listeners.
+
       // Query for recipes owned by the user
       const ownedRecipesQuery = query(recipesRef, where('userId', '==', userId));
-      
-      // Listen for real-time updates
-      const unsubscribe = onSnapshot(ownedRecipesQuery, (snapshot: { docs: QueryDocumentSnapshot[] }) => {
-          const recipesData: Recipe[] = [];
-          snapshot.docs.forEach((doc: QueryDocumentSnapshot) => {
-            recipesData.push({ id: doc.id, ...doc.data() } as Recipe);
-        });
-        
-        // Also fetch recipes shared with this user
-        // We'll do this by checking all recipes and filtering client-side
-        // (In production, you might want to use a separate collection for better performance)
-        getDocs(recipesRef).then((allRecipesSnapshot) => {
-          allRecipesSnapshot.docs.forEach((doc: QueryDocumentSnapshot) => {
-            const recipeData = doc.data() as Recipe;
-            // Add recipe if it's shared with this user and not already in the list
-            if (recipeData.sharedWith && 
-                recipeData.sharedWith.includes(userId) && 
-                recipeData.userId !== userId &&
-                !recipesData.find(r => r.id === doc.id)) {
-              recipesData.push({ id: doc.id, ...recipeData });
-            }
-          });
-          setRecipes(recipesData);
-        });
+
+      // Query for recipes shared with the user
+      const sharedRecipesQuery = query(recipesRef, where('sharedWith', 'array-contains', userId));
+
+      // Latest results from each listener, merged whenever either updates
+      let ownedRecipes: Recipe[] = [];
+      let sharedRecipes: Recipe[] = [];
+
+      const publishRecipes = () => {
+        const recipesData: Recipe[] = [...ownedRecipes];
+        sharedRecipes.forEach(recipe => {
+          // Add recipe if it's shared with this user and not already in the list
+          if (recipe.userId !== userId && !recipesData.find(r => r.id === recipe.id)) {
+            recipesData.push(recipe);
+          }
         });
+        setRecipes(recipesData);
+      };
 
-        // Cleanup subscription on unmount
-        return () => unsubscribe();
+      // Listen for real-time updates on both queries
+      const unsubscribeOwned = onSnapshot(ownedRecipesQuery, (snapshot: { docs: QueryDocumentSnapshot[] }) => {
+        ownedRecipes = snapshot.docs.map((doc: QueryDocumentSnapshot) =>
+          ({ id: doc.id, ...doc.data() } as Recipe)
+        );
+        publishRecipes();
+      });
+
+      const unsubscribeShared = onSnapshot(sharedRecipesQuery, (snapshot: { docs: QueryDocumentSnapshot[] }) => {
+        sharedRecipes = snapshot.docs.map((doc: QueryDocumentSnapshot) =>
+          ({ id: doc.id, ...doc.data() } as Recipe)
+        );
+        publishRecipes();
+      });
+
+        // Cleanup subscriptions on unmount
+        return () => {
+          unsubscribeOwned();
+          unsubscribeShared();
+        };
       } catch (error) {
-        console.error('Error loading recipes:', error);
+        secureError('Error loading recipes:', error);
       setRecipes([]);
       }
   }, [user]);
@@ -487,7 +598,6 @@ const App: React.FC = () => {
       const userId = currentUser.uid;
       
       // Create a query that gets meal plans owned by the user
-        const mealPlansRef = collection(db, collections.mealPlans);
       const mealPlansQuery = query(mealPlansRef, where('userId', '==', userId));
       
       const unsubscribe = onSnapshot(mealPlansQuery, (snapshot: { docs: QueryDocumentSnapshot[] }) => {
@@ -505,7 +615,7 @@ const App: React.FC = () => {
         // Cleanup subscription on unmount
         return () => unsubscribe();
       } catch (error) {
-        console.error('Error loading weekly meal plans:', error);
+        secureError('Error loading weekly meal plans:', error);
       setWeeklyMealPlans({});
       }
   }, [user]);
@@ -524,7 +634,6 @@ const App: React.FC = () => {
       const userId = currentUser.uid;
       
       // Create a query that gets notes owned by the user
-        const notesRef = collection(db, collections.notes);
       const notesQuery = query(notesRef, where('userId', '==', userId));
       
       const unsubscribe = onSnapshot(notesQuery, (snapshot: { docs: QueryDocumentSnapshot[] }) => {
@@ -538,7 +647,7 @@ const App: React.FC = () => {
 
         return () => unsubscribe();
       } catch (error) {
-        console.error('Error loading notes:', error);
+        secureError('Error loading notes:', error);
       setNotes({});
       }
   }, [user]);
@@ -612,7 +721,7 @@ const App: React.FC = () => {
       }, {} as Record<string, any>);
       
       // Save to Firestore
-      const docRef = await addDoc(collection(db, collections.recipes), cleanedRecipe);
+      const docRef = await addDoc(recipesRef, cleanedRecipe);
       
       // Log successful creation (sanitized - no document IDs or user IDs)
       secureLog('[Recipe Creation] ✅ Recipe saved successfully:', {
@@ -760,9 +869,8 @@ const App: React.FC = () => {
     }
 
     try {
-      // Initialize Gemini AI
-      const genAI = new GoogleGenerativeAI(apiKey);
-      const model = genAI.getGenerativeModel({ 
+      // Get the shared Gemini model (client and wrapper are reused across calls)
+      const model = getGeminiModel({
         model: 'models/gemini-2.5-flash',
         systemInstruction: 'You are a precise JSON processor. Return only valid JSON without markdown code blocks or explanations.'
       });
@@ -817,7 +925,7 @@ Return the same JSON structure with 'category' and 'emoji' fields added to each
 Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
 
       // Call Gemini API
-      const result = await model.generateContent(categorizationPrompt);
+      const result = await withGeminiRetry(() => model.generateContent(categorizationPrompt));
       const response = await result.response;
       const text = response.text();
 
@@ -856,7 +964,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
 
       return grouped;
     } catch (error: any) {
-      console.error('Error categorizing ingredients with Gemini:', error);
+      secureError('Error categorizing ingredients with Gemini:', error);
       // Fallback: return ingredients in a default category if API fails
       const fallback: CategorizedIngredients = {
         'Pantry': ingredients.map(ing => ({
@@ -891,7 +999,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       }
       
       // Log meal plan save attempt
-      console.log('[Meal Plan] Saving meal plan:', {
+      secureLog('[Meal Plan] Saving meal plan:', {
         weekRange: weekRange,
         userId: userId,
         userEmail: userEmail,
@@ -903,7 +1011,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       // This ensures meal plans are user-specific and future-proof
       // Format: {userId}_{weekRange}
       const docId = `${userId}_${weekRange}`;
-      const docRef = doc(db, collections.mealPlans, docId);
+      const docRef = doc(mealPlansRef, docId);
       
       // Validate document ID format
       if (!docId.includes('_') || !docId.startsWith(userId + '_')) {
@@ -943,7 +1051,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       }
       
       // Log successful save
-      console.log('[Meal Plan] ✅ Meal plan saved successfully:', {
+      secureLog('[Meal Plan] ✅ Meal plan saved successfully:', {
         docId: docId,
         weekRange: weekRange,
         userId: userId,
@@ -951,7 +1059,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         timestamp: new Date().toISOString()
       });
     } catch (error: any) {
-      console.error('[Meal Plan] ❌ Error saving meal plan:', {
+      secureError('[Meal Plan] ❌ Error saving meal plan:', {
         error: error.message,
         code: error.code,
         weekRange: weekRange,
@@ -983,7 +1091,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       }
       
       // Log shopping list update attempt
-      console.log('[Shopping List] Updating shopping list:', {
+      secureLog('[Shopping List] Updating shopping list:', {
         weekRange: weekRange,
         userId: userId,
         userEmail: userEmail,
@@ -996,7 +1104,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       // This ensures shopping lists are user-specific and future-proof
       // Format: {userId}_{weekRange}
       const docId = `${userId}_${weekRange}`;
-      const docRef = doc(db, collections.shoppingLists, docId);
+      const docRef = doc(shoppingListsRef, docId);
       
       // Validate document ID format
       if (!docId.includes('_') || !docId.startsWith(userId + '_')) {
@@ -1034,7 +1142,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       }
       
       // Log successful update
-      console.log('[Shopping List] ✅ Shopping list updated successfully:', {
+      secureLog('[Shopping List] ✅ Shopping list updated successfully:', {
         docId: docId,
         weekRange: weekRange,
         userId: userId,
@@ -1042,7 +1150,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         timestamp: new Date().toISOString()
       });
     } catch (error: any) {
-      console.error('[Shopping List] ❌ Error updating shopping list:', {
+      secureError('[Shopping List] ❌ Error updating shopping list:', {
         error: error.message,
         code: error.code,
         weekRange: weekRange,
@@ -1077,14 +1185,14 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       const existingNote = notes[date];
       if (existingNote && existingNote.id) {
         // Update existing note
-        const noteRef = doc(db, collections.notes, existingNote.id);
+        const noteRef = doc(notesRef, existingNote.id);
         await updateDoc(noteRef, { content });
       } else {
         // Create new note
-        await addDoc(collection(db, collections.notes), note);
+        await addDoc(notesRef, note);
       }
     } catch (error) {
-      console.error('Error saving note:', error);
+      secureError('Error saving note:', error);
       throw error;
     }
   };
@@ -1116,155 +1224,8 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
    * 
    * @param date - The date object that was selected
    */
-  const handleDateSelect = async (date: Date) => {
+  const handleDateSelect = (date: Date) => {
     setSelectedDate(date);
-    
-    // Get the day of the week and week range
-    const dayOfWeek = date.toLocaleDateString('en-US', { weekday: 'long' });
-    const weekRange = getWeekRange(date);
-    
-    // Check if there's a meal plan for this week
-    if (weeklyMealPlans[weekRange]) {
-      // Get the recipe ID for this day
-      const recipeId = weeklyMealPlans[weekRange][dayOfWeek];
-      
-      if (recipeId) {
-        // Find the recipe in our recipes array
-        const recipe = recipes.find(r => r.id === recipeId);
-        if (recipe) {
-          // Set the selected meal to this recipe
-          setSelectedMeal(recipeId);
-        }
-      } else {
-        // No meal selected for this day
-        setSelectedMeal('');
-      }
-    } else {
-      // No meal plan for this week
-      setSelectedMeal('');
-    }
-  };
-  
-  /**
-   * Meal Selection Handler
-   * 
-   * This function is called when a user selects a different meal from the dropdown.
-   * It updates the selectedMeal state with the new meal choice.
-   * 
-   * @param event - The change event from the select element
-   */
-  const handleMealChange = (event: React.ChangeEvent<HTMLSelectElement>) => {
-    setSelectedMeal(event.target.value);
-    // Reset the saved state when a new meal is selected
-    setSavedMessage('');
-  };
-  
-  /**
-   * Save Meal Plan Handler
-   * 
-   * This function is called when the save button is clicked.
-   * It sets the saved state to true to show a confirmation message.
-   * In a real app, this would save the data to a database or API.
-   */
-  const handleSaveMeal = async () => {
-    if (!selectedDate || !selectedMeal) return;
-
-    try {
-      const weekRange = getWeekRange(selectedDate);
-      const dayOfWeek = selectedDate.toLocaleDateString('en-US', { weekday: 'long' });
-
-      // Get existing meal plan for this week
-      const currentUser = requireAuth();
-      const userId = currentUser.uid;
-      const docId = `${userId}_${weekRange}`;
-      const mealPlanRef = doc(db, collections.mealPlans, docId);
-      const mealPlanDoc = await getDoc(mealPlanRef);
-      const existingPlan = mealPlanDoc.exists() ? mealPlanDoc.data() as WeeklyMealPlan : null;
-
-      const updatedPlan = {
-        ...(existingPlan || {}),
-        [dayOfWeek]: selectedMeal
-      };
-
-      // Remove userId from the plan object before passing to saveMealPlanToFirestore
-      const { userId: _, ...planWithoutUserId } = updatedPlan;
-      await saveMealPlanToFirestore(weekRange, planWithoutUserId);
-      setSelectedMeal('');
-    } catch (error) {
-      console.error('Error saving meal plan:', error);
-    }
-  };
-
-  /**
-   * Recipe Selection Handler
-   * 
-   * This function is called when a user selects a recipe from the dropdown.
-   * It updates the selectedRecipe state with the chosen recipe name.
-   * 
-   * @param event - The change event from the select element
-   */
-  const handleRecipeSelect = (event: React.ChangeEvent<HTMLSelectElement>) => {
-    setSelectedRecipe(event.target.value);
-  };
-
-  /**
-   * Add Ingredient Handler
-   * 
-   * This function is called when a user adds a new ingredient to a recipe.
-   * It adds the ingredient to the newRecipeIngredients array.
-   */
-  const handleAddIngredient = () => {
-    if (newIngredient.trim()) {
-      setNewRecipeIngredients([...newRecipeIngredients, newIngredient.trim()]);
-      setNewIngredient(''); // Clear the input
-    }
-  };
-
-  /**
-   * Remove Ingredient Handler
-   * 
-   * This function is called when a user removes an ingredient from a recipe.
-   * It removes the ingredient at the specified index from the newRecipeIngredients array.
-   * 
-   * @param index - The index of the ingredient to remove
-   */
-  const handleRemoveIngredient = (index: number) => {
-    setNewRecipeIngredients(newRecipeIngredients.filter((_, i) => i !== index));
-  };
-
-  /**
-   * Save Recipe Handler
-   * 
-   * This function handles saving a new recipe.
-   * It validates the input, saves to Firestore, and updates the UI.
-   * Note: This is a legacy function. The RecipeLibrary component has its own save handler.
-   */
-  const handleSaveRecipe = async () => {
-    if (!newRecipeName.trim() || newRecipeIngredients.length === 0) return;
-
-    try {
-      // Create recipe object without id and userId
-      // saveRecipeToFirestore will automatically add the userId
-      const recipe: Omit<Recipe, 'id' | 'userId'> = {
-        name: newRecipeName.trim(),
-        cuisine: 'Misc',
-        ingredients: newRecipeIngredients
-      };
-
-      await saveRecipeToFirestore(recipe);
-      
-      // Reset form
-      setNewRecipeName('');
-      setNewRecipeIngredients([]);
-      setIsAddingRecipe(false);
-      setRecipeSaved(true);
-      
-      // Hide success message after 3 seconds
-      setTimeout(() => setRecipeSaved(false), 3000);
-    } catch (error) {
-      console.error('Error saving recipe:', error);
-      // Handle error (e.g., show error message to user)
-    }
   };
 
   /**
@@ -1279,44 +1240,6 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     setSelectedWeek(event.target.value);
   };
 
-  /**
-   * Toggle Checked Item Handler
-   * 
-   * This function is called when a user clicks a checkbox in the shopping list.
-   * It toggles the checked state of the item in the checkedItems Set.
-   * 
-   * @param ingredient - The ingredient string to toggle
-   */
-  const handleToggleCheckedItem = async (item: string) => {
-    // Update local state immediately for responsive UI
-    setCheckedItems(prev => {
-      const newChecked = new Set(prev);
-      if (newChecked.has(item)) {
-        newChecked.delete(item);
-      } else {
-        newChecked.add(item);
-      }
-      // Save to Firestore in the background (user-specific)
-      if (selectedWeek) {
-        try {
-          const currentUser = requireAuth();
-          const userId = currentUser.uid;
-          const docId = `${userId}_${selectedWeek}`;
-          const shoppingListRef = doc(db, collections.shoppingLists, docId);
-        setDoc(shoppingListRef, {
-          checkedItems: Array.from(newChecked),
-            weekRange: selectedWeek,
-            userId: userId
-        }, { merge: true });
-          secureLog(`[Shopping List] Updated checked items for week ${selectedWeek}`);
-        } catch (error) {
-          secureError('[Shopping List] Error saving checked items:', error);
-        }
-      }
-      return newChecked;
-    });
-  };
-
   /**
    * Get Aggregated Ingredients Function
    * 
@@ -1329,13 +1252,10 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     if (!selectedWeek) return [];
 
     try {
-      // Get meal plan for the selected week (user-specific)
-      const currentUser = requireAuth();
-      const userId = currentUser.uid;
-      const docId = `${userId}_${selectedWeek}`;
-      const mealPlanRef = doc(db, collections.mealPlans, docId);
-      const mealPlanDoc = await getDoc(mealPlanRef);
-      const weekPlan = mealPlanDoc.exists() ? mealPlanDoc.data() as WeeklyMealPlan : null;
+      // Get meal plan for the selected week from local state.
+      // The meal plans listener (onSnapshot) already mirrors every plan owned
+      // by this user, so re-fetching the document here was a redundant read.
+      const weekPlan = weeklyMealPlans[selectedWeek] || null;
 
       if (!weekPlan) return [];
 
@@ -1349,12 +1269,9 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
       Object.entries(weekPlan).forEach(([day, mealIds]) => {
         // Skip non-day keys (like userId, weekRange, createdAt, updatedAt)
         if (!validDays.includes(day)) return;
-        
-        // Skip if mealIds is not a string or is empty
-        if (typeof mealIds !== 'string' || !mealIds.trim()) return;
-        
-        // Split mealIds and process each meal
-        const mealIdList = mealIds.split(',').map(id => id.trim()).filter(id => id.length > 0);
+
+        // Normalize the day entry (array or legacy string) and process each meal
+        const mealIdList = parseMealIds(mealIds);
         mealIdList.forEach(mealId => {
           // Find the recipe
           const recipe = recipes.find(r => r.id === mealId);
@@ -1377,7 +1294,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         .map(([ingredient, count]) => `${ingredient} (x${count})`)
         .sort((a, b) => a.localeCompare(b));
     } catch (error) {
-      console.error('Error getting aggregated ingredients:', error);
+      secureError('Error getting aggregated ingredients:', error);
       return [];
     }
   };
@@ -1395,12 +1312,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
    * @returns A formatted date string (e.g., "Monday, January 1, 2023")
    */
   const formatDate = (date: Date): string => {
-    return date.toLocaleDateString('en-US', { 
-      weekday: 'long', 
-      year: 'numeric', 
-      month: 'long', 
-      day: 'numeric' 
-    });
+    return fullDateFormat.format(date);
   };
   
   //===========================================================================
@@ -1470,12 +1382,13 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
                         currentYear === selectedDate.getFullYear();
       
       // Check if this date has meals assigned
-      const dayOfWeek = date.toLocaleDateString('en-US', { weekday: 'long' });
+      const dayOfWeek = weekdayFormat.format(date);
       const weekRange = getWeekRange(date);
       const mealPlan = weeklyMealPlans[weekRange];
-      const hasMeals = mealPlan && mealPlan[dayOfWeek] && mealPlan[dayOfWeek] !== '';
-      const mealNames = hasMeals 
-        ? mealPlan[dayOfWeek].split(',')
+      const dayMealIds = mealPlan ? parseMealIds(mealPlan[dayOfWeek]) : [];
+      const hasMeals = dayMealIds.length > 0;
+      const mealNames = hasMeals
+        ? dayMealIds
           .map(id => recipes.find(r => r.id === id)?.name)
           .filter(Boolean)
           .join(', ')
@@ -1515,7 +1428,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
           >
             &lt;
           </button>
-          <h2>{new Date(currentYear, currentMonth).toLocaleDateString('en-US', { month: 'long', year: 'numeric' })}</h2>
+          <h2>{monthYearFormat.format(new Date(currentYear, currentMonth))}</h2>
           <button 
             className="month-nav-button"
             onClick={handleNextMonth}
@@ -1547,14 +1460,10 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     // Load pre-selected meals when date changes
     useEffect(() => {
       if (selectedDate) {
-        const dayOfWeek = selectedDate.toLocaleDateString('en-US', { weekday: 'long' });
+        const dayOfWeek = weekdayFormat.format(selectedDate);
         const weekRange = getWeekRange(selectedDate);
         const mealPlan = weeklyMealPlans[weekRange];
-        if (mealPlan && mealPlan[dayOfWeek]) {
-          setSelectedMeals(mealPlan[dayOfWeek].split(','));
-        } else {
-          setSelectedMeals([]);
-        }
+        setSelectedMeals(mealPlan ? parseMealIds(mealPlan[dayOfWeek]) : []);
       }
     }, [selectedDate, weeklyMealPlans]);
 
@@ -1577,26 +1486,24 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
 
       try {
         const weekRange = getWeekRange(selectedDate);
-        const dayOfWeek = selectedDate.toLocaleDateString('en-US', { weekday: 'long' });
+        const dayOfWeek = weekdayFormat.format(selectedDate);
 
-        // Get existing meal plan for this week
-        const currentUser = requireAuth();
-        const userId = currentUser.uid;
-        const docId = `${userId}_${weekRange}`;
-        const mealPlanRef = doc(db, collections.mealPlans, docId);
-        const mealPlanDoc = await getDoc(mealPlanRef);
-        const existingPlan = mealPlanDoc.exists() ? mealPlanDoc.data() as WeeklyMealPlan : null;
+        // Get existing meal plan for this week from local state.
+        // weeklyMealPlans is kept in sync by the onSnapshot listener, so this
+        // avoids a Firestore round-trip on every meal add/remove.
+        const existingPlan = weeklyMealPlans[weekRange] || null;
 
         const updatedPlan = {
           ...(existingPlan || {}),
-          [dayOfWeek]: mealsToSave.join(',')
+          // Store the IDs as a native array field; readers normalize via parseMealIds
+          [dayOfWeek]: mealsToSave
         };
 
         // Remove userId from the plan object before passing to saveMealPlanToFirestore
         const { userId: _, ...planWithoutUserId } = updatedPlan;
         await saveMealPlanToFirestore(weekRange, planWithoutUserId);
       } catch (error) {
-        console.error('Error auto-saving meal plan:', error);
+        secureError('Error auto-saving meal plan:', error);
       }
     };
 
@@ -1782,11 +1689,11 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     useEffect(() => {
       const fetchOwnerInfo = async () => {
         try {
-          const ownerProfileRef = doc(db, collections.users, userId);
-          const ownerProfileSnap = await getDoc(ownerProfileRef);
-          
-          if (ownerProfileSnap.exists()) {
-            const profileData = ownerProfileSnap.data() as UserProfile;
+          // Served from the module-level profile cache after the first fetch,
+          // so selecting the same owner's recipes repeatedly costs no reads.
+          const profileData = await getUserProfileCached(userId);
+
+          if (profileData) {
             if (profileData.username) {
               setOwnerInfo(`@${profileData.username}`);
             } else if (profileData.firstName && profileData.lastName) {
@@ -1798,7 +1705,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
             setOwnerInfo('Unknown user');
           }
         } catch (error) {
-          console.error('Error fetching owner info:', error);
+          secureError('Error fetching owner info:', error);
           setOwnerInfo('Unknown user');
         }
       };
@@ -1935,7 +1842,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     useEffect(() => {
       // Only process if we're on the recipe library tab (component is mounted) and there's a pending recipe
       if (pendingRecipeFromChatbot && activeTab === 'recipeLibrary') {
-        console.log('RecipeLibrary: Pre-filling recipe form with:', pendingRecipeFromChatbot);
+        secureLog('RecipeLibrary: Pre-filling recipe form with:', pendingRecipeFromChatbot);
         
         // Switch to Add New Recipe tab
         setRecipeViewMode('addNewRecipe');
@@ -1993,19 +1900,49 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         
         // Get unique owner IDs
         const uniqueOwnerIds = Array.from(new Set(sharedRecipes.map(recipe => recipe.userId)));
-        
-        // Load emails for these users
+
+        // Serve owners we've already seen from the module-level profile cache
+        // and only query Firestore for the rest. Across repeated visits to
+        // this tab the same handful of owners recurs, so most loads hit the
+        // cache and issue no reads at all.
         const emailsMap: Record<string, string> = {};
-        for (const ownerId of uniqueOwnerIds) {
+        const uncachedOwnerIds: string[] = [];
+        uniqueOwnerIds.forEach(ownerId => {
+          if (userProfileCache.has(ownerId)) {
+            emailsMap[ownerId] = userProfileCache.get(ownerId)?.email || 'Unknown User';
+          } else {
+            uncachedOwnerIds.push(ownerId);
+          }
+        });
+
+        // Load emails for the remaining users in batches instead of one getDoc
+        // per owner. Fetching documents one at a time pays a network
+        // round-trip per user; a single 'in' query on document ID returns a
+        // whole batch in one request. Firestore limits 'in' queries to 10
+        // values, so we chunk the ID list.
+        const batchSize = 10;
+        for (let i = 0; i < uncachedOwnerIds.length; i += batchSize) {
+          const batchIds = uncachedOwnerIds.slice(i, i + batchSize);
           try {
-            const userDoc = await getDoc(doc(db, collections.users, ownerId));
-            if (userDoc.exists()) {
+            const batchQuery = query(usersRef, where(documentId(), 'in', batchIds));
+            const batchSnapshot = await getDocs(batchQuery);
+            batchSnapshot.docs.forEach((userDoc: QueryDocumentSnapshot) => {
               const userData = userDoc.data() as UserProfile;
-              emailsMap[ownerId] = userData.email;
-            }
+              emailsMap[userDoc.id] = userData.email;
+              userProfileCache.set(userDoc.id, userData);
+            });
+            // Record owners with no profile document so they aren't re-queried
+            batchIds.forEach(ownerId => {
+              if (!(ownerId in emailsMap)) {
+                emailsMap[ownerId] = 'Unknown User';
+                userProfileCache.set(ownerId, null);
+              }
+            });
           } catch (error) {
-            secureError('[App] Error loading user email:', error);
-            emailsMap[ownerId] = 'Unknown User';
+            secureError('[App] Error loading user emails:', error);
+            batchIds.forEach(ownerId => {
+              emailsMap[ownerId] = 'Unknown User';
+            });
           }
         }
         setSharedRecipeUserEmails(emailsMap);
@@ -2018,7 +1955,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     // This effect runs whenever editingRecipe changes and pre-fills the form
     useEffect(() => {
       if (editingRecipe) {
-        console.log('[My Recipes] Loading recipe data for editing:', editingRecipe.name);
+        secureLog('[My Recipes] Loading recipe data for editing:', editingRecipe.name);
         setLocalRecipeName(editingRecipe.name);
         setLocalCuisine(editingRecipe.cuisine as Cuisine);
         setLocalIngredients(editingRecipe.ingredients);
@@ -2035,7 +1972,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
     // This effect runs whenever selectedMyRecipe changes and pre-fills the form
     useEffect(() => {
       if (selectedMyRecipe) {
-        console.log('[My Recipes] Loading recipe data for editing:', selectedMyRecipe.name);
+        secureLog('[My Recipes] Loading recipe data for editing:', selectedMyRecipe.name);
         setLocalRecipeName(selectedMyRecipe.name);
         setLocalCuisine(selectedMyRecipe.cuisine as Cuisine);
         setLocalIngredients(selectedMyRecipe.ingredients);
@@ -2157,7 +2094,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
           };
           
           // Update in Firestore
-          const recipeRef: DocumentReference<DocumentData> = doc(db, collections.recipes, editingRecipe.id);
+          const recipeRef: DocumentReference<DocumentData> = doc(recipesRef, editingRecipe.id);
           
           // Build update object and remove undefined fields
           // Firestore doesn't allow undefined values - they must be omitted entirely
@@ -2219,7 +2156,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         // Hide success message after 3 seconds
         setTimeout(() => setRecipeSaved(false), 3000);
       } catch (error: any) {
-        console.error('Error saving recipe:', error);
+        secureError('Error saving recipe:', error);
         setSaveError(error.message || 'Failed to save recipe. Please try again.');
         // Keep error visible for 5 seconds
         setTimeout(() => setSaveError(null), 5000);
@@ -2298,7 +2235,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         };
         
         // Update in Firestore
-        const recipeRef: DocumentReference<DocumentData> = doc(db, collections.recipes, selectedMyRecipe.id);
+        const recipeRef: DocumentReference<DocumentData> = doc(recipesRef, selectedMyRecipe.id);
         
         // Build update object and remove undefined fields
         // Firestore doesn't allow undefined values - they must be omitted entirely
@@ -2337,7 +2274,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         // Hide success message after 3 seconds
         setTimeout(() => setRecipeSaved(false), 3000);
       } catch (error: any) {
-        console.error('Error updating recipe:', error);
+        secureError('Error updating recipe:', error);
         setSaveError(error.message || 'Failed to update recipe. Please try again.');
         // Keep error visible for 5 seconds
         setTimeout(() => setSaveError(null), 5000);
@@ -3347,15 +3284,21 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
 
         setLoading(true);
         try {
-          const aggregatedIngredients = await getAggregatedIngredients();
-          setIngredients(aggregatedIngredients);
-          
           // Load misc items, checked items, and categorized ingredients from Firestore for the selected week (user-specific)
           const currentUser = requireAuth();
           const userId = currentUser.uid;
           const docId = `${userId}_${selectedWeek}`;
-          const shoppingListRef = doc(db, collections.shoppingLists, docId);
-          const shoppingListDoc = await getDoc(shoppingListRef);
+          const shoppingListRef = doc(shoppingListsRef, docId);
+
+          // The ingredient aggregation and the shopping list document read are
+          // independent, so run them concurrently instead of awaiting one after
+          // the other. Total wait time becomes the slower of the two requests
+          // rather than their sum.
+          const [aggregatedIngredients, shoppingListDoc] = await Promise.all([
+            getAggregatedIngredients(),
+            getDoc(shoppingListRef)
+          ]);
+          setIngredients(aggregatedIngredients);
           
           if (shoppingListDoc.exists()) {
             const data = shoppingListDoc.data();
@@ -3370,11 +3313,11 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
             
             if (cachedHash === currentHash && cachedCategorized) {
               // Use cached categorization - no API call needed
-              console.log('[Shopping List] Using cached categorization');
+              secureLog('[Shopping List] Using cached categorization');
               setCategorizedIngredients(cachedCategorized);
             } else if (aggregatedIngredients.length > 0) {
               // Ingredients changed or no cache - need to categorize
-              console.log('[Shopping List] Categorizing ingredients with Gemini AI');
+              secureLog('[Shopping List] Categorizing ingredients with Gemini AI');
               setCategorizing(true);
               try {
                 const categorized = await categorizeIngredientsWithGemini(aggregatedIngredients);
@@ -3387,9 +3330,9 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
                   weekRange: selectedWeek,
                   userId: userId
                 }, { merge: true });
-                console.log('[Shopping List] Saved categorized ingredients to Firestore');
+                secureLog('[Shopping List] Saved categorized ingredients to Firestore');
               } catch (error) {
-                console.error('Error categorizing ingredients:', error);
+                secureError('Error categorizing ingredients:', error);
                 // On error, set empty categorization (will show uncategorized)
                 setCategorizedIngredients({});
               } finally {
@@ -3406,7 +3349,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
             
             // If we have ingredients, categorize them
             if (aggregatedIngredients.length > 0) {
-              console.log('[Shopping List] First time categorizing ingredients');
+              secureLog('[Shopping List] First time categorizing ingredients');
               setCategorizing(true);
               try {
                 const categorized = await categorizeIngredientsWithGemini(aggregatedIngredients);
@@ -3422,9 +3365,9 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
                   weekRange: selectedWeek,
                   userId: userId
                 }, { merge: true });
-                console.log('[Shopping List] Saved categorized ingredients to Firestore');
+                secureLog('[Shopping List] Saved categorized ingredients to Firestore');
               } catch (error) {
-                console.error('Error categorizing ingredients:', error);
+                secureError('Error categorizing ingredients:', error);
                 setCategorizedIngredients({});
               } finally {
                 setCategorizing(false);
@@ -3434,7 +3377,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
             }
           }
         } catch (error) {
-          console.error('Error loading items:', error);
+          secureError('Error loading items:', error);
           setIngredients([]);
           setMiscItems([]);
           setCheckedItems(new Set());
@@ -3463,7 +3406,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
             const currentUser = requireAuth();
             const userId = currentUser.uid;
             const docId = `${userId}_${selectedWeek}`;
-            const shoppingListRef = doc(db, collections.shoppingLists, docId);
+            const shoppingListRef = doc(shoppingListsRef, docId);
         setDoc(shoppingListRef, {
           checkedItems: Array.from(newChecked),
             weekRange: selectedWeek,
@@ -3488,7 +3431,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         
         // Save to Firestore (user-specific)
         const docId = `${userId}_${selectedWeek}`;
-        const shoppingListRef = doc(db, collections.shoppingLists, docId);
+        const shoppingListRef = doc(shoppingListsRef, docId);
         await setDoc(shoppingListRef, {
           miscItems: newMiscItems,
           weekRange: selectedWeek,
@@ -3498,7 +3441,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         setMiscItems(newMiscItems);
         setMiscItem('');
       } catch (error) {
-        console.error('Error adding misc item:', error);
+        secureError('Error adding misc item:', error);
       }
     };
 
@@ -3512,7 +3455,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         
         // Update Firestore (user-specific)
         const docId = `${userId}_${selectedWeek}`;
-        const shoppingListRef = doc(db, collections.shoppingLists, docId);
+        const shoppingListRef = doc(shoppingListsRef, docId);
         await setDoc(shoppingListRef, {
           miscItems: newMiscItems,
           weekRange: selectedWeek,
@@ -3521,7 +3464,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         
         setMiscItems(newMiscItems);
       } catch (error) {
-        console.error('Error removing misc item:', error);
+        secureError('Error removing misc item:', error);
       }
     };
 
@@ -3694,7 +3637,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
               <div className="meal-overview">
                 {['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'].map((day) => {
                   const mealPlan = weeklyMealPlans[selectedWeek];
-                  const mealIds = mealPlan?.[day]?.split(',') || [];
+                  const mealIds = mealPlan ? parseMealIds(mealPlan[day]) : [];
                   const date = new Date(selectedWeek.split(' - ')[0]);
                   const dayIndex = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'].indexOf(day);
                   date.setDate(date.getDate() + dayIndex);
@@ -3799,7 +3742,7 @@ Input: ${JSON.stringify({ ingredients: ingredientsForAI })}`;
         
         {/* Display the current date and user info in the banner */}
         <div style={{ display: 'flex', alignItems: 'center', gap: '1rem', marginLeft: 'auto', marginRight: '20px' }}>
-          <p className="banner-date">{new Date().toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' })}</p>
+          <p className="banner-date">{bannerDateFormat.format(new Date())}</p>
           
           {/* User Dropdown */}
           <div className="user-dropdown-container" style={{ position: 'relative' }}>
@@ -4,8 +4,8 @@
 // useEffect allows us to perform side effects (like scrolling) when data changes
 import React, { useState, useRef, useEffect } from 'react';
 
-// Import the Google Generative AI library for Gemini API
-import { GoogleGenerativeAI } from '@google/generative-ai';
+// Import the shared Gemini client (one instance reused across calls)
+import { getGeminiModel, withGeminiRetry } from './utils/geminiClient';
 
 // Import prompt configurations
 import promptsConfig from './prompts.json';
@@ -156,13 +156,10 @@ const Chatbot: React.FC<ChatbotProps> = ({ isOpen, onClose, onSaveRecipe, existi
       secureLog('[Chatbot] API Key present:', !!apiKey);
       secureLog('[Chatbot] Sending message:', userMessage);
       
-      // Initialize the Gemini API client
-      const genAI = new GoogleGenerativeAI(apiKey);
-      
-      // Get the Gemini model
+      // Get the shared Gemini model (the client is created once and reused)
       // Using 'models/gemini-2.5-flash' which is fast and widely available
       // Alternative models: 'models/gemini-2.5-pro' (more capable but slower)
-      const model = genAI.getGenerativeModel({ model: 'models/gemini-2.5-flash' });
+      const model = getGeminiModel({ model: 'models/gemini-2.5-flash' });
 
       // Create a conversation history for context (excluding the welcome message and the current user message)
       // This helps the AI understand the conversation flow
@@ -192,7 +189,7 @@ const Chatbot: React.FC<ChatbotProps> = ({ isOpen, onClose, onSaveRecipe, existi
 
       // Send the current message and get the response
       secureLog('[Chatbot] Sending to Gemini API...');
-      const result = await chat.sendMessage(enhancedUserMessage);
+      const result = await withGeminiRetry(() => chat.sendMessage(enhancedUserMessage));
       const response = await result.response;
       const text = response.text();
       
@@ -222,23 +219,28 @@ const Chatbot: React.FC<ChatbotProps> = ({ isOpen, onClose, onSaveRecipe, existi
       secureError('[Chatbot] Error calling Gemini API:', error);
       
       // Extract more detailed error information
-      let errorMessage = '❌ Sorry, I encountered an error.';
-      
+      // Collect the pieces in an array and join once at the end - repeated
+      // string += re-allocates the whole message on every append
+      const errorParts = ['❌ Sorry, I encountered an error.'];
+
       if (error?.message) {
         // If we have a specific error message, include it
-        errorMessage += ` ${error.message}`;
+        errorParts.push(` ${error.message}`);
       } else if (error?.error?.message) {
         // Some errors are nested in an error object
-        errorMessage += ` ${error.error.message}`;
+        errorParts.push(` ${error.error.message}`);
       } else if (typeof error === 'string') {
-        errorMessage += ` ${error}`;
+        errorParts.push(` ${error}`);
       }
-      
+
       // Add troubleshooting tips
-      errorMessage += '\n\n💡 Troubleshooting tips:\n';
-      errorMessage += '• Make sure your API key is correct\n';
-      errorMessage += '• Restart your dev server after adding the API key\n';
-      errorMessage += '• Check the browser console for more details';
+      errorParts.push(
+        '\n\n💡 Troubleshooting tips:\n',
+        '• Make sure your API key is correct\n',
+        '• Restart your dev server after adding the API key\n',
+        '• Check the browser console for more details'
+      );
+      const errorMessage = errorParts.join('');
       
       // Show a user-friendly error message with details
       setMessages(prev => [...prev, {
@@ -272,14 +274,13 @@ const Chatbot: React.FC<ChatbotProps> = ({ isOpen, onClose, onSaveRecipe, existi
         throw new Error('API key not found');
       }
 
-      const genAI = new GoogleGenerativeAI(apiKey);
-      const model = genAI.getGenerativeModel({ model: 'models/gemini-2.5-flash' });
+      const model = getGeminiModel({ model: 'models/gemini-2.5-flash' });
 
       // Create a prompt that includes the format instructions and the recipe text
       const formatPrompt = `${recipeFormatConfig.formatPrompt}\n\n${recipeFormatConfig.extractionPrompt}\n\nRecipe text to format:\n\n${lastRecipeResponse}`;
 
       // Get formatted recipe from AI
-      const result = await model.generateContent(formatPrompt);
+      const result = await withGeminiRetry(() => model.generateContent(formatPrompt));
       const response = await result.response;
       const formattedText = response.text();
 
@@ -13,8 +13,8 @@ import {
 } from 'firebase/auth';
 
 // Import our Firebase auth instance and Firestore
-import { auth, db, collections } from '../firebase';
-import { doc, setDoc, serverTimestamp, getDoc, collection, query, where, getDocs } from 'firebase/firestore';
+import { auth, usersRef } from '../firebase';
+import { doc, setDoc, serverTimestamp, getDoc, query, where, getDocs } from 'firebase/firestore';
 
 // Import secure logging utilities
 import { secureLog, secureError } from '../utils/secureLogger';
@@ -81,7 +81,6 @@ const Auth: React.FC<AuthProps> = ({ onAuthSuccess }) => {
   const checkUsernameExists = async (username: string): Promise<boolean> => {
     try {
       const normalizedUsername = username.trim().toLowerCase();
-      const usersRef = collection(db, collections.users);
       const usernameQuery = query(usersRef, where('username', '==', normalizedUsername));
       const querySnapshot = await getDocs(usernameQuery);
       return !querySnapshot.empty;
@@ -191,7 +190,7 @@ const Auth: React.FC<AuthProps> = ({ onAuthSuccess }) => {
         
         // Create user profile in Firestore users collection
         try {
-          const userProfileRef = doc(db, collections.users, userCredential.user.uid);
+          const userProfileRef = doc(usersRef, userCredential.user.uid);
           await setDoc(userProfileRef, {
             uid: userCredential.user.uid,
             email: userCredential.user.email || email,
@@ -214,7 +213,7 @@ const Auth: React.FC<AuthProps> = ({ onAuthSuccess }) => {
         
         // Check if user profile exists, create if it doesn't (for existing users)
         try {
-          const userProfileRef = doc(db, collections.users, userCredential.user.uid);
+          const userProfileRef = doc(usersRef, userCredential.user.uid);
           const userProfileSnap = await getDoc(userProfileRef);
           
           if (!userProfileSnap.exists()) {
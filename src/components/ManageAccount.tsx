@@ -2,8 +2,8 @@
 import React, { useState, useEffect } from 'react';
 
 // Import Firebase and Firestore functions
-import { db, collections, requireAuth } from '../firebase';
-import { doc, getDoc, setDoc, serverTimestamp, collection, query, where, getDocs } from 'firebase/firestore';
+import { usersRef, requireAuth } from '../firebase';
+import { doc, getDoc, setDoc, serverTimestamp, query, where, getDocs } from 'firebase/firestore';
 import { User } from 'firebase/auth';
 
 // Import CSS for styling
@@ -71,7 +71,6 @@ const ManageAccount: React.FC<ManageAccountProps> = ({ isOpen, onClose, user })
   const checkUsernameExists = async (username: string, excludeUserId?: string): Promise<boolean> => {
     try {
       const normalizedUsername = username.trim().toLowerCase();
-      const usersRef = collection(db, collections.users);
       const usernameQuery = query(usersRef, where('username', '==', normalizedUsername));
       const querySnapshot = await getDocs(usernameQuery);
       
@@ -127,7 +126,7 @@ const ManageAccount: React.FC<ManageAccountProps> = ({ isOpen, onClose, user })
     
     try {
       const currentUser = requireAuth();
-      const userProfileRef = doc(db, collections.users, currentUser.uid);
+      const userProfileRef = doc(usersRef, currentUser.uid);
       const userProfileSnap = await getDoc(userProfileRef);
       
       if (userProfileSnap.exists()) {
@@ -216,7 +215,7 @@ const ManageAccount: React.FC<ManageAccountProps> = ({ isOpen, onClose, user })
 
     try {
       const currentUser = requireAuth();
-      const userProfileRef = doc(db, collections.users, currentUser.uid);
+      const userProfileRef = doc(usersRef, currentUser.uid);
       
       // Update the user profile with new fields
       const normalizedUsername = username.trim().toLowerCase() || null;
@@ -2,9 +2,8 @@
 import React, { useState, useEffect } from 'react';
 
 // Import Firebase and Firestore functions
-import { db, collections, requireAuth } from '../firebase';
+import { recipesRef, usersRef, requireAuth } from '../firebase';
 import { 
-  collection, 
   getDocs, 
   doc, 
   updateDoc, 
@@ -51,9 +50,22 @@ interface ShareRecipeModalProps {
   currentUser: User | null;
 }
 
+/**
+ * Module-level cache of the registered user list.
+ *
+ * The set of registered users changes rarely compared to how often the share
+ * modal is opened, yet every open re-read the entire users collection. Keep
+ * the last snapshot for a few minutes and only hit Firestore when the cache
+ * is empty or expired. The cache stores the unfiltered list; the current
+ * user is excluded per caller.
+ */
+let cachedUsers: UserProfile[] | null = null;
+let cachedUsersFetchedAt = 0;
+const USERS_CACHE_TTL_MS = 5 * 60 * 1000; // 5 minutes
+
 /**
  * ShareRecipeModal Component
- * 
+ *
  * This component provides a modal interface for sharing recipes with other users.
  * It allows users to:
  * - View all registered users in a dropdown
@@ -158,27 +170,36 @@ const ShareRecipeModal: React.FC<ShareRecipeModalProps> = ({
     
     try {
       const currentUserAuth = requireAuth();
-      const usersRef = collection(db, collections.users);
-      
-      // Get all users
-      const usersSnapshot = await getDocs(usersRef);
-      const usersList: UserProfile[] = [];
-      
-      usersSnapshot.forEach((doc) => {
-        const userData = doc.data() as UserProfile;
-        // Exclude current user from the list
-        if (userData.uid !== currentUserAuth.uid) {
-          usersList.push(userData);
-        }
-      });
-      
+
+      // Use the cached user list when it's still fresh; otherwise fetch the
+      // collection once and refresh the cache. This removes a full collection
+      // read from every modal open.
+      const now = Date.now();
+      if (!cachedUsers || now - cachedUsersFetchedAt >= USERS_CACHE_TTL_MS) {
+        // Get all users
+        const usersSnapshot = await getDocs(usersRef);
+        const fetchedUsers: UserProfile[] = [];
+
+        usersSnapshot.forEach((doc) => {
+          fetchedUsers.push(doc.data() as UserProfile);
+        });
+
+        cachedUsers = fetchedUsers;
+        cachedUsersFetchedAt = now;
+      }
+
+      // Exclude current user from the list
+      const usersList = cachedUsers.filter(
+        userData => userData.uid !== currentUserAuth.uid
+      );
+
       // Sort users by username, then by email if no username
       usersList.sort((a, b) => {
         const nameA = a.username || a.email;
         const nameB = b.username || b.email;
         return nameA.localeCompare(nameB);
       });
-      
+
       setAllUsers(usersList);
     } catch (err: any) {
       console.error('Error loading users:', err);
@@ -234,7 +255,7 @@ const ShareRecipeModal: React.FC<ShareRecipeModalProps> = ({
         return;
       }
 
-      const recipeRef = doc(db, collections.recipes, recipe.id);
+      const recipeRef = doc(recipesRef, recipe.id);
       
       // Build update object - set the entire sharedWith array
       // Note: Per user's clarification, we don't remove user IDs when unsharing for future public sharing
@@ -1,7 +1,7 @@
 // Import the functions you need from the SDKs you need
-import { initializeApp } from "firebase/app";
+import { initializeApp, getApp, getApps } from "firebase/app";
 import { getAuth, onAuthStateChanged, User, signOut as firebaseSignOut } from "firebase/auth";
-import { getFirestore } from "firebase/firestore";
+import { getFirestore, collection } from "firebase/firestore";
 
 // Your web app's Firebase configuration
 // For Firebase JS SDK v7.20.0 and later, measurementId is optional
@@ -16,7 +16,10 @@ const firebaseConfig = {
 };
 
 // Initialize Firebase
-const app = initializeApp(firebaseConfig);
+// Guarded so re-evaluating this module (hot reload, tests importing it more
+// than once) reuses the existing app instead of initializeApp throwing a
+// duplicate-app error and rebuilding SDK state.
+const app = getApps().length > 0 ? getApp() : initializeApp(firebaseConfig);
 
 // Initialize Firebase Authentication and get a reference to the service
 export const auth = getAuth(app);
@@ -34,6 +37,16 @@ export const collections = {
   users: 'users' // User profiles collection
 };
 
+// Precompiled collection references
+// collection() re-resolves the path through the SDK's internals on every
+// call; these references are resolved once at module load and shared by
+// every query/doc call site (e.g. doc(recipesRef, id)).
+export const recipesRef = collection(db, collections.recipes);
+export const mealPlansRef = collection(db, collections.mealPlans);
+export const shoppingListsRef = collection(db, collections.shoppingLists);
+export const notesRef = collection(db, collections.notes);
+export const usersRef = collection(db, collections.users);
+
 /**
  * Validate if a user is properly authenticated
  * 
@@ -190,15 +203,41 @@ export const onAuthStateChange = (callback: (user: User | null) => void): (() =>
   };
 };
 
+/**
+ * User Profile Cache Key
+ *
+ * Builds the localStorage key under which the user's profile is cached for
+ * fast first paint. Defined here so the sign-out path can clear the same
+ * key the profile listener writes.
+ *
+ * @param uid - The Firebase Auth UID of the user
+ * @returns The localStorage key for that user's cached profile
+ */
+export const userProfileCacheKey = (uid: string): string => {
+  return `mealplanner:userProfile:${uid}`;
+};
+
 /**
  * Sign Out
- * 
+ *
  * This function signs out the current user.
- * 
+ * It also clears the user's cached profile from localStorage so PII
+ * (email, first/last name) doesn't outlive the session on shared machines.
+ *
  * @returns A promise that resolves when sign out is complete
  */
 export const signOut = async (): Promise<void> => {
   try {
+    // Clear the cached profile before the session ends
+    const uid = auth.currentUser?.uid;
+    if (uid) {
+      try {
+        localStorage.removeItem(userProfileCacheKey(uid));
+      } catch (error) {
+        // localStorage may be unavailable - nothing to clear in that case
+      }
+    }
+
     await firebaseSignOut(auth);
     console.log('[Auth] User signed out successfully');
   } catch (error) {
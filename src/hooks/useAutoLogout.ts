@@ -5,29 +5,40 @@ import { useEffect, useRef } from 'react';
 // Import Firebase authentication functions
 import { signOut } from '../firebase';
 
+// Import the sanitizing logger so auto-logout events go through the same
+// redaction pipeline as the rest of the app's logging
+import { secureLog, secureError } from '../utils/secureLogger';
+
 /**
  * useAutoLogout Hook
- * 
+ *
  * This custom hook implements automatic logout after a period of inactivity.
  * It monitors user activity (mouse movements, clicks, keyboard presses, etc.)
  * and automatically signs the user out if they're inactive for the specified duration.
- * 
+ *
+ * Activity events only record a timestamp - they never touch the timer. A
+ * single timeout is armed for the full inactivity window; when it fires it
+ * compares the elapsed time against the last recorded activity and either
+ * signs the user out or re-arms itself for exactly the time remaining. This
+ * keeps the per-event cost to one Date.now() call even when events like
+ * mousemove fire dozens of times per second.
+ *
  * Features:
  * - Tracks user activity across multiple event types
- * - Resets the inactivity timer on any user activity
+ * - O(1) activity handling: no timer teardown/re-creation per event
  * - Automatically signs out after the inactivity period
  * - Cleans up event listeners when component unmounts
- * 
+ *
  * @param timeoutMinutes - Number of minutes of inactivity before auto-logout (default: 30)
  * @param onLogout - Optional callback function to call when auto-logout occurs
- * 
+ *
  * @example
  * // Auto-logout after 30 minutes of inactivity
  * useAutoLogout(30);
- * 
+ *
  * // Auto-logout after 15 minutes with a callback
  * useAutoLogout(15, () => {
- *   console.log('User was automatically logged out');
+ *   secureLog('User was automatically logged out');
  * });
  */
 export const useAutoLogout = (
@@ -38,46 +49,67 @@ export const useAutoLogout = (
   // useRef persists across re-renders but doesn't cause re-renders when changed
   const timeoutRef = useRef<NodeJS.Timeout | null>(null);
 
+  // Timestamp of the most recent user activity
+  const lastActivityRef = useRef<number>(Date.now());
+
   /**
-   * Reset Inactivity Timer
-   * 
-   * This function clears any existing timeout and starts a new one.
-   * It's called whenever user activity is detected.
+   * Setup Activity Listeners
+   *
+   * This effect runs when the component mounts and sets up event listeners
+   * to detect user activity. It also arms the inactivity timer.
    */
-  const resetTimer = () => {
-    // Clear any existing timeout
-    if (timeoutRef.current) {
-      clearTimeout(timeoutRef.current);
-    }
-
-    // Set a new timeout for the specified number of minutes
-    // Convert minutes to milliseconds (minutes * 60 seconds * 1000 milliseconds)
+  useEffect(() => {
     const timeoutMs = timeoutMinutes * 60 * 1000;
-    
-    timeoutRef.current = setTimeout(async () => {
+
+    /**
+     * Record User Activity
+     *
+     * Called for every activity event. Deliberately does nothing but stamp
+     * the current time - the timer itself decides what to do when it fires.
+     */
+    const recordActivity = () => {
+      lastActivityRef.current = Date.now();
+    };
+
+    /**
+     * Check Inactivity Deadline
+     *
+     * Runs when the armed timeout fires. If the user has been inactive for
+     * the full window, sign them out; otherwise re-arm the timer for exactly
+     * the time remaining until the deadline.
+     */
+    const checkInactivity = async () => {
+      const elapsed = Date.now() - lastActivityRef.current;
+
+      if (elapsed < timeoutMs) {
+        // Activity happened since the timer was armed - sleep until the
+        // deadline implied by the most recent activity
+        timeoutRef.current = setTimeout(checkInactivity, timeoutMs - elapsed);
+        return;
+      }
+
       try {
         // Sign out the user
         await signOut();
-        
+
         // Call the optional callback if provided
         if (onLogout) {
           onLogout();
         }
-        
-        console.log(`Auto-logged out after ${timeoutMinutes} minutes of inactivity`);
+
+        secureLog(`Auto-logged out after ${timeoutMinutes} minutes of inactivity`);
       } catch (error) {
-        console.error('Error during auto-logout:', error);
+        secureError('Error during auto-logout:', error);
+      } finally {
+        // Re-arm for the next session. The hook stays mounted across
+        // sign-out/sign-in (App renders it unconditionally), so without this
+        // the first auto-logout would permanently disable the feature until
+        // the page is reloaded.
+        lastActivityRef.current = Date.now();
+        timeoutRef.current = setTimeout(checkInactivity, timeoutMs);
       }
-    }, timeoutMs);
-  };
+    };
 
-  /**
-   * Setup Activity Listeners
-   * 
-   * This effect runs when the component mounts and sets up event listeners
-   * to detect user activity. It also sets up the initial inactivity timer.
-   */
-  useEffect(() => {
     // List of events that indicate user activity
     // We listen to multiple events to catch all types of user interaction
     const activityEvents = [
@@ -92,17 +124,18 @@ export const useAutoLogout = (
     // Add event listeners for each activity event
     // We use document to catch activity anywhere on the page
     activityEvents.forEach(event => {
-      document.addEventListener(event, resetTimer, true);
+      document.addEventListener(event, recordActivity, true);
     });
 
-    // Start the initial timer
-    resetTimer();
+    // Arm the single inactivity timer
+    lastActivityRef.current = Date.now();
+    timeoutRef.current = setTimeout(checkInactivity, timeoutMs);
 
     // Cleanup function - runs when component unmounts or dependencies change
     return () => {
       // Remove all event listeners
       activityEvents.forEach(event => {
-        document.removeEventListener(event, resetTimer, true);
+        document.removeEventListener(event, recordActivity, true);
       });
 
       // Clear any pending timeout
@@ -112,4 +145,3 @@ export const useAutoLogout = (
     };
   }, [timeoutMinutes]); // Re-run if timeoutMinutes changes
 };
-
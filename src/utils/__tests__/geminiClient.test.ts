@@ -0,0 +1,56 @@
+/**
+ * Gemini Client Tests
+ *
+ * Tests for the shared Gemini client helpers including:
+ * - Retry behavior for transient errors
+ * - Immediate rethrow of non-transient errors
+ * - Successful results passing through untouched
+ */
+
+import { describe, it, expect, jest } from '@jest/globals';
+
+// Mock the Gemini SDK - these tests only exercise the retry wrapper,
+// not the model construction
+jest.mock('@google/generative-ai', () => ({
+  GoogleGenerativeAI: jest.fn()
+}));
+
+import { withGeminiRetry } from '../geminiClient';
+
+describe('withGeminiRetry', () => {
+  it('should return the result of a successful operation', async () => {
+    const operation = jest.fn<Promise<string>, []>().mockResolvedValue('result');
+
+    const result = await withGeminiRetry(operation);
+
+    expect(result).toBe('result');
+    expect(operation).toHaveBeenCalledTimes(1);
+  });
+
+  it('should retry transient errors and return the eventual success', async () => {
+    const operation = jest.fn<Promise<string>, []>()
+      .mockRejectedValueOnce(new Error('[429 Too Many Requests] rate limit exceeded'))
+      .mockResolvedValue('recovered');
+
+    const result = await withGeminiRetry(operation);
+
+    expect(result).toBe('recovered');
+    expect(operation).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not retry non-transient errors', async () => {
+    const operation = jest.fn<Promise<string>, []>()
+      .mockRejectedValue(new Error('[400 Bad Request] API key not valid'));
+
+    await expect(withGeminiRetry(operation)).rejects.toThrow('API key not valid');
+    expect(operation).toHaveBeenCalledTimes(1);
+  });
+
+  it('should give up after exhausting all attempts', async () => {
+    const operation = jest.fn<Promise<string>, []>()
+      .mockRejectedValue(new Error('[503 Service Unavailable] model overloaded'));
+
+    await expect(withGeminiRetry(operation)).rejects.toThrow('model overloaded');
+    expect(operation).toHaveBeenCalledTimes(3);
+  });
+});
@@ -0,0 +1,139 @@
+/**
+ * Shared Gemini API Client
+ *
+ * Every Gemini call site used to construct a fresh GoogleGenerativeAI client
+ * and model wrapper for each request. The client is stateless and depends
+ * only on the API key, so building it repeatedly is wasted work and prevents
+ * the underlying HTTP layer from reusing connections between calls.
+ *
+ * This module holds a single client instance plus one model wrapper per
+ * distinct model configuration, created lazily on first use and reused for
+ * the lifetime of the session.
+ *
+ * It also provides withGeminiRetry, which bounds how long a single request
+ * can hang and transparently retries transient failures (rate limits,
+ * server errors, dropped connections) with exponential backoff.
+ *
+ * Usage:
+ * import { getGeminiModel, withGeminiRetry } from './utils/geminiClient';
+ * const model = getGeminiModel({ model: 'models/gemini-2.5-flash' });
+ * const result = await withGeminiRetry(() => model.generateContent(prompt));
+ */
+
+import { GoogleGenerativeAI, GenerativeModel, ModelParams } from '@google/generative-ai';
+
+// Lazily-created client shared by every call site
+let genAI: GoogleGenerativeAI | null = null;
+
+// One model wrapper per distinct configuration (model name + system instruction)
+const modelCache = new Map<string, GenerativeModel>();
+
+/**
+ * Get a Gemini model wrapper, reusing the shared client and any previously
+ * created wrapper with the same configuration.
+ *
+ * @param params - The model configuration (model name, system instruction, etc.)
+ * @returns A reusable GenerativeModel instance
+ * @throws Error if the Gemini API key is not configured
+ */
+export const getGeminiModel = (params: ModelParams): GenerativeModel => {
+  const apiKey = process.env.REACT_APP_GEMINI_API_KEY;
+
+  if (!apiKey) {
+    throw new Error('Gemini API key not found. Please add REACT_APP_GEMINI_API_KEY to your .env file.');
+  }
+
+  // Create the shared client on first use
+  if (!genAI) {
+    genAI = new GoogleGenerativeAI(apiKey);
+  }
+
+  // Reuse an existing model wrapper for this configuration if we have one
+  const cacheKey = JSON.stringify(params);
+  let model = modelCache.get(cacheKey);
+  if (!model) {
+    model = genAI.getGenerativeModel(params);
+    modelCache.set(cacheKey, model);
+  }
+
+  return model;
+};
+
+// Retry/backoff configuration for Gemini requests
+const GEMINI_MAX_ATTEMPTS = 3;
+const GEMINI_BASE_DELAY_MS = 500;
+const GEMINI_TIMEOUT_MS = 30000;
+
+/**
+ * Check whether a Gemini error is worth retrying.
+ *
+ * Rate limits (429) and server-side errors (5xx) are transient: the same
+ * request typically succeeds moments later. Anything else (bad API key,
+ * malformed request, safety block) will fail identically on retry, so we
+ * surface it immediately.
+ *
+ * @param error - The error thrown by the Gemini SDK
+ * @returns true if the request should be retried
+ */
+const isTransientGeminiError = (error: unknown): boolean => {
+  const message = error instanceof Error ? error.message : String(error);
+  return (
+    /\[(429|500|502|503|504)[\s\]]/.test(message) ||
+    /\b(429|500|502|503|504)\b/.test(message) ||
+    /rate limit|overloaded|timed out|Failed to fetch|network/i.test(message)
+  );
+};
+
+/**
+ * Bound how long we wait for a promise before giving up.
+ *
+ * The browser fetch underneath the SDK is not aborted, but the caller's
+ * await is released so a hung connection cannot stall the UI indefinitely.
+ *
+ * @param promise - The promise to bound
+ * @param timeoutMs - Maximum time to wait in milliseconds
+ * @returns The promise's value, or a rejection once the timeout elapses
+ */
+const withTimeout = <T>(promise: Promise<T>, timeoutMs: number): Promise<T> => {
+  return new Promise<T>((resolve, reject) => {
+    const timer = setTimeout(
+      () => reject(new Error(`Gemini request timed out after ${timeoutMs}ms`)),
+      timeoutMs
+    );
+    promise.then(
+      value => { clearTimeout(timer); resolve(value); },
+      error => { clearTimeout(timer); reject(error); }
+    );
+  });
+};
+
+/**
+ * Run a Gemini request with a timeout and exponential-backoff retries.
+ *
+ * Each attempt is bounded to GEMINI_TIMEOUT_MS. Transient failures are
+ * retried up to GEMINI_MAX_ATTEMPTS times with delays of 500ms, 1000ms, ...
+ * between attempts; non-transient failures are rethrown immediately.
+ *
+ * @param operation - Function that issues the request (called once per attempt)
+ * @returns The result of the first successful attempt
+ * @throws The last error if every attempt fails
+ */
+export const withGeminiRetry = async <T>(operation: () => Promise<T>): Promise<T> => {
+  let lastError: unknown;
+
+  for (let attempt = 1; attempt <= GEMINI_MAX_ATTEMPTS; attempt++) {
+    try {
+      return await withTimeout(operation(), GEMINI_TIMEOUT_MS);
+    } catch (error) {
+      lastError = error;
+      if (attempt === GEMINI_MAX_ATTEMPTS || !isTransientGeminiError(error)) {
+        throw error;
+      }
+      const delayMs = GEMINI_BASE_DELAY_MS * Math.pow(2, attempt - 1);
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+    }
+  }
+
+  // Unreachable - the loop either returns or throws - but satisfies the compiler
+  throw lastError;
+};